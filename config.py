@@ -1,18 +1,23 @@
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from dotenv import load_dotenv
 from pathlib import Path
 
-# Load environment variables from .env file
-load_dotenv()
-
 # Project paths
 BASE_DIR = Path(__file__).resolve().parent
+
+# Load environment variables from .env file, but only when one exists and
+# we're not in production (CI/cron get their env from the orchestrator) -
+# skipping the stat+parse shaves startup on every invocation
+if not os.getenv('PRODUCTION') and (BASE_DIR / '.env').exists():
+    load_dotenv(BASE_DIR / '.env', override=False)
+
 TEMP_DIR = BASE_DIR / "temp"
 TEMP_DIR.mkdir(exist_ok=True)
 
-# Supabase configuration
-SUPABASE_URL = os.getenv('SUPABASE_URL')
-SUPABASE_KEY = os.getenv('SUPABASE_KEY')
+CACHE_DIR = BASE_DIR / ".cache"
+CACHE_DIR.mkdir(exist_ok=True)
 
 # BibleProject site URLs
 BP_BASE_URL = "https://bibleproject.com"
@@ -22,19 +27,89 @@ BP_CLASSROOM_URL = f"{BP_BASE_URL}/classroom"
 #FIXME: study notes diff than this
 BP_STUDY_NOTES_URL = f"{BP_BASE_URL}/explore"
 
-# Request settings
-USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-REQUEST_DELAY = float(os.getenv('REQUEST_DELAY', '1.0'))  # Delay between requests in seconds
-REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', '30'))  # Request timeout in seconds
 
-# Chatbot configuration
-DEFAULT_CHATBOT_ID = os.getenv('DEFAULT_CHATBOT_ID')
-DEFAULT_CONTENT_TYPE = "website" 
+@dataclass(frozen=True, slots=True)
+class Config:
+    """
+    Immutable snapshot of all environment-derived settings
+
+    Resolved once at import so the rest of the codebase never re-reads the
+    environment; frozen+slots gives cheap attribute access and makes the
+    instance safe to hand to worker threads/processes.
+    """
+    # Supabase configuration
+    supabase_url: str
+    supabase_key: str
+
+    # Request settings
+    user_agent: str
+    request_delay: float  # Delay between requests in seconds
+    request_timeout: int  # Request timeout in seconds
+
+    # Chatbot configuration
+    default_chatbot_id: str
+    default_content_type: str
+
+    # Audio processing
+    speech_to_text_api: str  # 'openai', 'google', 'azure'
+    openai_api_key: str
+    whisper_model: str
+    # Tempo factor applied with ffmpeg before uploading audio to Whisper.
+    # 2.0 halves both duration-billed time and upload bytes with negligible
+    # accuracy loss; set to 1.0 to upload audio unchanged. Timestamps are
+    # scaled back to the real timeline after transcription.
+    audio_speedup: float
+
+    # Processing settings
+    max_content_chunk_size: int  # Characters per chunk
+
+    # Content hashing
+    # 'xxh3_128' is much faster than SHA-256 and we only need the hash for
+    # duplicate detection, not cryptography. Set to 'sha256' to keep the old
+    # behavior. Rows hashed with SHA-256 before the switch are still matched
+    # (and rewritten) by the dedup lookup.
+    hash_algo: str
+
+
+@lru_cache(maxsize=1)
+def load_config() -> Config:
+    """
+    Build the Config snapshot from the environment
+
+    Cached so repeated calls are free; tests can reload after changing the
+    environment with load_config.cache_clear().
+    """
+    return Config(
+        supabase_url=os.getenv('SUPABASE_URL'),
+        supabase_key=os.getenv('SUPABASE_KEY'),
+        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        request_delay=float(os.getenv('REQUEST_DELAY', '1.0')),
+        request_timeout=int(os.getenv('REQUEST_TIMEOUT', '30')),
+        default_chatbot_id=os.getenv('DEFAULT_CHATBOT_ID'),
+        default_content_type="website",
+        speech_to_text_api=os.getenv('SPEECH_TO_TEXT_API', 'openai'),
+        openai_api_key=os.getenv('OPENAI_API_KEY'),
+        whisper_model=os.getenv('WHISPER_MODEL', 'whisper-1'),
+        audio_speedup=float(os.getenv('AUDIO_SPEEDUP', '2.0')),
+        max_content_chunk_size=int(os.getenv('MAX_CONTENT_CHUNK_SIZE', '4000')),
+        hash_algo=os.getenv('HASH_ALGO', 'xxh3_128'),
+    )
+
 
-# Audio processing
-SPEECH_TO_TEXT_API = os.getenv('SPEECH_TO_TEXT_API', 'openai')  # 'openai', 'google', 'azure'
-OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
-WHISPER_MODEL = os.getenv('WHISPER_MODEL', 'whisper-1')
+CONFIG = load_config()
 
-# Processing settings
-MAX_CONTENT_CHUNK_SIZE = int(os.getenv('MAX_CONTENT_CHUNK_SIZE', '4000'))  # Characters per chunk
\ No newline at end of file
+# Module-level aliases kept for existing importers; new code should prefer
+# `from config import CONFIG`
+SUPABASE_URL = CONFIG.supabase_url
+SUPABASE_KEY = CONFIG.supabase_key
+USER_AGENT = CONFIG.user_agent
+REQUEST_DELAY = CONFIG.request_delay
+REQUEST_TIMEOUT = CONFIG.request_timeout
+DEFAULT_CHATBOT_ID = CONFIG.default_chatbot_id
+DEFAULT_CONTENT_TYPE = CONFIG.default_content_type
+SPEECH_TO_TEXT_API = CONFIG.speech_to_text_api
+OPENAI_API_KEY = CONFIG.openai_api_key
+WHISPER_MODEL = CONFIG.whisper_model
+AUDIO_SPEEDUP = CONFIG.audio_speedup
+MAX_CONTENT_CHUNK_SIZE = CONFIG.max_content_chunk_size
+HASH_ALGO = CONFIG.hash_algo
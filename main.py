@@ -1,35 +1,49 @@
 import argparse
+import atexit
 import logging
+import queue
 import sys
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 
-# Import scrapers (to be implemented)
-from scrapers.podcasts import PodcastScraper
-# from scrapers.classroom import ClassroomScraper
-from scrapers.study_notes import StudyNotesScraper
+# Scraper/processor imports are deferred into the functions that need them:
+# they transitively pull in Supabase/httpx/selenium (~hundreds of ms cold),
+# which --help or a single-command run shouldn't pay for.
 from utils.helpers import cleanup_temp_files
 
-# Setup logging
+# Setup logging. The file sink sits behind a queue so log calls on hot
+# scraping/processing paths never block on disk IO - a background listener
+# thread drains the queue and does the actual writes.
+log_queue = queue.Queue(-1)
+file_handler = logging.FileHandler(f"bibleproject_scrape_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
+file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+log_listener = QueueListener(log_queue, file_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler(f"bibleproject_scrape_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
+        QueueHandler(log_queue)
     ]
 )
 
 logger = logging.getLogger(__name__)
 
-def scrape_podcasts(full_scrape: bool = False):
+def scrape_podcasts(full_scrape: bool = False, since: int = None):
     """
     Scrape BibleProject podcast content
-    
+
     Args:
         full_scrape: If True, scrape all podcasts. If False, only check first 20 for new content.
+        since: Only process episodes numbered >= this value
     """
     logger.info(f"Starting podcast scraper in {'full' if full_scrape else 'new content'} mode")
-    podcast_scraper = PodcastScraper(full_scrape=full_scrape)
+    from scrapers.podcasts import PodcastScraper
+
+    podcast_scraper = PodcastScraper(full_scrape=full_scrape, since=since)
     success = podcast_scraper.scrape()
     
     if success:
@@ -42,6 +56,7 @@ def scrape_classroom():
     Scrape BibleProject classroom content
     """
     logger.info("Starting classroom scraper")
+    # from scrapers.classroom import ClassroomScraper
     # classroom_scraper = ClassroomScraper()
     # classroom_scraper.scrape()
     logger.info("Classroom scraping not yet implemented")
@@ -51,6 +66,8 @@ def scrape_study_notes():
     Scrape BibleProject study notes
     """
     logger.info("Starting study notes scraper")
+    from scrapers.study_notes import StudyNotesScraper
+
     study_notes_scraper = StudyNotesScraper()
     success = study_notes_scraper.scrape()
     if success:
@@ -58,24 +75,35 @@ def scrape_study_notes():
     else:
         logger.error("Study notes scraping failed")
 
-def process_pending(content_type: str = None, limit: int = 40):
+def process_pending(content_type: str = None, limit: int = 40, urgent: bool = False):
     """
     Process any pending content (transcribe audio, create embeddings)
-    
+
     Args:
         content_type: Type of content to process (e.g. 'podcast', 'classroom', 'study_notes')
         limit: Maximum number of items to process
+        urgent: Transcribe new audio synchronously instead of via the Batch API
     """
     logger.info(f"Processing pending content (type: {content_type}, limit: {limit})")
     from processors.runner import process_pending_content
-    
-    processed_count = process_pending_content(content_type=content_type, limit=limit)
-    
+
+    processed_count = process_pending_content(content_type=content_type, limit=limit, urgent=urgent)
+
     if processed_count > 0:
         logger.info(f"Successfully processed {processed_count} pending items")
     else:
         logger.info("No pending items processed")
 
+def drain_batches():
+    """
+    Collect finished OpenAI transcription batches and store the results
+    """
+    logger.info("Draining transcription batches")
+    from processors.audio import AudioProcessor
+
+    drained = AudioProcessor().drain_batches()
+    logger.info(f"Stored {drained} batched transcriptions")
+
 def main():
     """Main entry point for the scraper"""
     parser = argparse.ArgumentParser(description='BibleProject content scraper')
@@ -87,6 +115,9 @@ def main():
     parser.add_argument('--full-podcasts', action='store_true', help='Run full podcast scrape (all podcasts)')
     parser.add_argument('--content-type', type=str, help='Type of content to process (e.g. podcast, classroom, study_notes)')
     parser.add_argument('--limit', type=int, help='Maximum number of items to process')
+    parser.add_argument('--since', type=int, help='Only process podcast episodes numbered >= this value')
+    parser.add_argument('--drain-batches', action='store_true', help='Collect finished OpenAI transcription batches')
+    parser.add_argument('--urgent', action='store_true', help='Transcribe new audio synchronously instead of via the Batch API')
     
     args = parser.parse_args()
     
@@ -98,7 +129,7 @@ def main():
     try:
         # Determine what to run based on arguments
         if args.podcasts or args.full:
-            scrape_podcasts(full_scrape=args.full_podcasts)
+            scrape_podcasts(full_scrape=args.full_podcasts, since=args.since)
             
         if args.classroom or args.full:
             scrape_classroom()
@@ -106,11 +137,14 @@ def main():
         if args.study_notes or args.full:
             scrape_study_notes()
             
-        if args.process or args.full:           
+        if args.process or args.full:
             # Set default limit if not specified
             limit = args.limit if args.limit is not None else 40
-            process_pending(content_type=args.content_type, limit=limit)
-            
+            process_pending(content_type=args.content_type, limit=limit, urgent=args.urgent)
+
+        if args.drain_batches:
+            drain_batches()
+
         logger.info("Scraping completed successfully")
         cleanup_temp_files()
         
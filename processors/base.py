@@ -1,12 +1,32 @@
 from abc import ABC, abstractmethod
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
-from db.supabase import SupabaseManager
+from db.supabase import get_supabase
 
 logger = logging.getLogger(__name__)
 
+# Single-writer gate for bulk Supabase flushes: worker threads overlap
+# their CPU work freely, but writes go out one batch at a time so the
+# shared connection pool is never contended by concurrent bulk inserts
+_db_write_sem = threading.BoundedSemaphore(1)
+
+@dataclass(slots=True)
+class ChunkRow:
+    """
+    One processed chunk headed for chatbot_sources
+
+    A slotted row object rather than a {'text': ..., 'metadata': ...}
+    wrapper dict - processors emit hundreds of chunks per document, so
+    the per-chunk wrapper allocation adds up on the hot path.
+    """
+    text: str
+    metadata: Dict[str, Any]
+
 class BaseProcessor(ABC):
     """
     Base class for content processors with common functionality
@@ -22,86 +42,149 @@ class BaseProcessor(ABC):
             content_type: Type of content this processor handles (None for all types). Defaults to None.
         """
         self.content_type = content_type
-        self.db = SupabaseManager()
+        self.db = get_supabase()
     
     @abstractmethod
-    def process_content(self, content: str, metadata: Dict[str, Any]) -> List[str]:
+    def process_content(self, content: str, metadata: Dict[str, Any]) -> List[ChunkRow]:
         """
         Process raw content into chunks suitable for the RAG system
-        
+
         Args:
             content: Raw content text
             metadata: Content metadata
-            
+
         Returns:
-            List of processed content chunks
+            List of processed content chunks as ChunkRow objects
         """
         pass
         
-    def process_pending_items(self, limit: int = 10) -> int:
+    # Flush accumulated chunk rows to the DB once this many are buffered
+    WRITE_BATCH_ROWS = 500
+
+    def process_items(self, items: List[Dict[str, Any]]) -> int:
+        """
+        Process a pre-fetched list of content rows
+
+        Lets the runner fetch rows for several content types in one
+        grouped query and hand each processor its slice.
+
+        Args:
+            items: Content rows, as returned by get_pending_content
+
+        Returns:
+            Number of successfully processed items
+        """
+        return self.process_pending_items(limit=len(items), items=items)
+
+    def process_pending_items(self, limit: int = 10,
+                              items: Optional[List[Dict[str, Any]]] = None) -> int:
         """
         Process pending items from the database for this content type
-        
+
+        Chunk rows are accumulated across items and written with one bulk
+        insert (embeddings batched inside it), and item statuses flushed
+        with one bulk update - two round-trips per batch instead of one
+        per chunk plus one per item.
+
         Args:
             limit: Maximum number of items to process
-            
+            items: Pre-fetched content rows; skips the DB fetch when given
+
         Returns:
             Number of successfully processed items
         """
         logger.info(f"Processing pending items for content type: {self.content_type}")
         #Returns DB entries from 'scrape_content_index' table that are pending
-        pending_items = self.db.get_pending_content(content_type=self.content_type, limit=limit)
+        if items is None:
+            pending_items = self.db.get_pending_content(content_type=self.content_type, limit=limit)
+        else:
+            pending_items = items
         processed_count = 0
-        
+
+        pending_rows: List[Dict[str, Any]] = []
+        # (item id, first row index, past-last row index) per chunked item
+        row_spans: List[tuple] = []
+        status_updates: List[Dict[str, str]] = []
+
+        def flush_rows() -> None:
+            """Bulk-insert buffered rows and resolve their items' statuses"""
+            nonlocal processed_count
+            if not row_spans:
+                return
+            with _db_write_sem:
+                inserted = self.db.add_many_to_chatbot_sources(pending_rows)
+            for item_id, first, last in row_spans:
+                if first == last or any(inserted[first:last]):
+                    status_updates.append({'id': item_id, 'status': 'processed'})
+                    processed_count += 1
+                else:
+                    status_updates.append({'id': item_id, 'status': 'failed'})
+            pending_rows.clear()
+            row_spans.clear()
+
+        # Partition out empty items up front - they fail straight into the
+        # bulk status update without occupying a pool worker
+        real_items = []
         for item in pending_items:
-            try:
-                # Process the content into chunks
-                content = item.get('text_content', '')
-                metadata = item.get('metadata', {})
-                
-                if not content:
-                    logger.warning(f"Empty content for item {item['id']}")
-                    self.db.update_content_status(item['id'], 'failed', chatbot_source_id=None)
-                    continue
-                
-                # Process content returns a list of dicts with 'text' and 'metadata'
-                chunk_objects = self.process_content(content, metadata)
-                
-                # Store each chunk in the database
-                for i, chunk_obj in enumerate(chunk_objects):
-                    chunk_text = chunk_obj['text']
-                    chunk_metadata = chunk_obj['metadata']
-                    
-                    # Add original content ID to metadata
-                    chunk_metadata['original_content_id'] = item['id']
-                    
-                    # Create a title for this chunk
-                    chunk_title = f"{item.get('title', 'Untitled')}"
-                    
-                    # Add to chatbot sources
-                    #ChatbotID is handled in the 'add_to_chatbot_sources' function
-                    link_url = item.get('source_url') or item.get('download_url')
-                    chatbot_source_id = self.db.add_to_chatbot_sources(
-                        content=chunk_text,
-                        title=chunk_title,
-                        source_url=link_url,
-                        content_type=item['content_type'],
-                        metadata=chunk_metadata,
-                        content_index_id=item['id']
-                    )
-                
-                # Mark as processed
-                self.db.update_content_status(
-                    item['id'], 
-                    'processed', 
-                    processed_content=None,
-                    chatbot_source_id=None
-                )
-                
-                processed_count += 1
-                
-            except Exception as e:
-                logger.exception(f"Error processing item {item['id']}: {e}")
-                self.db.update_content_status(item['id'], 'failed')
-        
+            if item.get('text_content'):
+                real_items.append(item)
+            else:
+                logger.warning(f"Empty content for item {item['id']}")
+                status_updates.append({'id': item['id'], 'status': 'failed'})
+
+        # Chunk items in parallel - the per-item work (regex cleaning, chunk
+        # splitting) is independent across items, so it overlaps across the
+        # pool while the DB flushes stay serialized behind _db_write_sem
+        def chunk_one(item: Dict[str, Any]):
+            """CPU side only: clean and split one item into chunk objects"""
+            return self.process_content(item['text_content'], item.get('metadata', {}))
+
+        results: Dict[Any, Any] = {}
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = {pool.submit(chunk_one, item): item for item in real_items}
+            for future in as_completed(futures):
+                item = futures[future]
+                try:
+                    results[item['id']] = future.result()
+                except Exception as e:
+                    logger.exception(f"Error processing item {item['id']}: {e}")
+                    results[item['id']] = e
+
+        # Accumulate rows in the original item order
+        for item in real_items:
+            outcome = results.get(item['id'])
+
+            if isinstance(outcome, Exception):
+                status_updates.append({'id': item['id'], 'status': 'failed'})
+                continue
+
+            # Create a title for this chunk
+            chunk_title = f"{item.get('title', 'Untitled')}"
+            #ChatbotID is handled in the 'add_many_to_chatbot_sources' function
+            link_url = item.get('source_url') or item.get('download_url')
+
+            first = len(pending_rows)
+            for chunk_obj in outcome:
+                chunk_metadata = chunk_obj.metadata
+
+                # Add original content ID to metadata
+                chunk_metadata['original_content_id'] = item['id']
+
+                pending_rows.append({
+                    'content': chunk_obj.text,
+                    'title': chunk_title,
+                    'source_url': link_url,
+                    'content_type': item['content_type'],
+                    'metadata': chunk_metadata,
+                    'content_index_id': item['id']
+                })
+            row_spans.append((item['id'], first, len(pending_rows)))
+
+            if len(pending_rows) >= self.WRITE_BATCH_ROWS:
+                flush_rows()
+
+        flush_rows()
+        with _db_write_sem:
+            self.db.update_many_status(status_updates)
+
         return processed_count
\ No newline at end of file
@@ -7,30 +7,48 @@ import config
 
 logger = logging.getLogger(__name__)
 
-def process_pending_content(content_type: Optional[str] = None, limit: int = 40) -> int:
+# Dispatch tables built once at import - membership checks in the runner
+# are O(1) set hits instead of fresh-list linear scans per call
+_TEXT_TYPES = frozenset({'article', 'book', 'text', 'research_paper', 'blog', 'website', 'bible'})
+_AUDIO_TYPES = frozenset({'podcast', 'speech', 'video'})
+_ALL_TYPES = _TEXT_TYPES | _AUDIO_TYPES
+
+def process_pending_content(content_type: Optional[str] = None, limit: int = 40, urgent: bool = False) -> int:
     """
     Process pending content in the database
-    
+
     Args:
         content_type: Type of content to process (None for all types)
         limit: Maximum number of items to process
-        
+        urgent: Transcribe new audio synchronously instead of via the
+            OpenAI Batch API
+
     Returns:
         Number of successfully processed items
     """
+    if content_type is not None and content_type not in _ALL_TYPES:
+        raise ValueError(f"Unknown content type: {content_type}")
+
     total_processed = 0
-    
+
     # Initialize processors based on content type
-    if content_type in [None, 'article', 'book', 'text', 'research_paper', 'blog', 'website', 'bible']:
+    if content_type is None or content_type in _TEXT_TYPES:
         text_processor = TextProcessor(content_type=content_type)
-        processed = text_processor.process_pending_items(limit=limit)
+        if content_type is None:
+            # One grouped query across all text types instead of an
+            # unfiltered fetch that could also pull in audio rows
+            grouped = text_processor.db.get_pending_content_grouped(sorted(_TEXT_TYPES), limit=limit)
+            items = [row for rows in grouped.values() for row in rows][:limit]
+            processed = text_processor.process_items(items)
+        else:
+            processed = text_processor.process_pending_items(limit=limit)
         total_processed += processed
         logger.info(f"Processed {processed} text items")
     
-    if content_type in [None, 'podcast', 'speech', 'video']:
+    if content_type is None or content_type in _AUDIO_TYPES:
         audio_processor = AudioProcessor(content_type=content_type)
         # Process new podcasts (audio files that need transcription)
-        processed_new = audio_processor.process_new_podcasts(limit=limit)
+        processed_new = audio_processor.process_new_podcasts(limit=limit, urgent=urgent)
         processed_pending = audio_processor.process_pending_podcasts(limit=limit)
         total_processed += processed_new + processed_pending
         logger.info(f"Processed {processed_new} new podcast items")
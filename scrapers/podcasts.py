@@ -1,35 +1,89 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Optional
 from pathlib import Path
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
+import json
 import time
 import os
 import re
 
-from .base import BaseScraper
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+from config import CACHE_DIR
+from .base import BaseScraper, BS_PARSER
 
 logger = logging.getLogger(__name__)
 
+EPISODE_RE = re.compile(r'Episode \d+')
+
+# Episode URLs observed on previous runs; incremental scrapes stop
+# paginating as soon as a page adds only already-seen episodes
+_SEEN_CACHE = CACHE_DIR / "podcasts_seen.json"
+
 class PodcastScraper(BaseScraper):
     """Scraper for Bible Project podcasts"""
     
-    def __init__(self, full_scrape: bool = False):
+    def __init__(self, full_scrape: bool = False, since: Optional[int] = None):
         super().__init__("podcasts")
         self.base_url = "https://bibleproject.com/podcasts/the-bible-project-podcast/"
         self.driver = None
         self.full_scrape = full_scrape
+        # Only process episodes numbered >= since when given
+        self.since = since
+
+    @staticmethod
+    def _load_seen_urls() -> set:
+        """Load the episode URLs recorded by previous runs"""
+        try:
+            with open(_SEEN_CACHE, 'r') as f:
+                return set(json.load(f))
+        except (OSError, ValueError):
+            return set()
+
+    @staticmethod
+    def _save_seen_urls(urls: set) -> None:
+        """Atomically record episode URLs for the next incremental run"""
+        try:
+            tmp_path = _SEEN_CACHE.with_suffix('.json.part')
+            with open(tmp_path, 'w') as f:
+                json.dump(sorted(urls), f)
+            os.replace(tmp_path, _SEEN_CACHE)
+        except OSError as e:
+            logger.warning(f"Failed to update podcast URL cache: {e}")
         
     def _init_driver(self):
         """Initialize Selenium WebDriver"""
         options = webdriver.ChromeOptions()
         options.add_argument('--headless')  # Run in headless mode
         options.add_argument('--window-size=1920,1080')  # Set a standard window size
+        # The scraper only reads the DOM: don't decode images, and return
+        # from get() at DOMContentLoaded instead of waiting for every
+        # lazy-loaded asset
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.set_capability('pageLoadStrategy', 'eager')
         self.driver = webdriver.Chrome(options=options)
+
+        # Block heavy assets and trackers at the network layer so 'Load
+        # more' cycles aren't waiting on image/font/analytics fetches
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {
+                'urls': ['*.png', '*.jpg', '*.jpeg', '*.gif',
+                         '*.woff', '*.woff2', '*.mp4',
+                         'https://www.google-analytics.com/*',
+                         'https://connect.facebook.net/*']
+            })
+        except Exception as e:
+            logger.warning(f"CDP resource blocking unavailable: {e}")
         
     def _scroll_to_element(self, element):
         """Scroll an element into view"""
@@ -43,95 +97,203 @@ class PodcastScraper(BaseScraper):
         
         if self.full_scrape:
             return self._load_all_podcasts()
-        else:
+
+        # Incremental: paginate only until a page adds no unseen episodes
+        # (first run has no cache and falls back to the first page)
+        seen = self._load_seen_urls()
+        if not seen:
             return self._get_podcast_links()
-        
-    def _load_all_podcasts(self) -> List[Dict]:
-        """Load all podcasts by clicking the 'Load more' button until no more podcasts"""
-        podcasts = []
+        return self._load_all_podcasts(known=seen)
+
+    def _load_all_podcasts(self, known: Optional[set] = None) -> List[Dict]:
+        """
+        Load podcasts by clicking the 'Load more' button until no more podcasts
+
+        Args:
+            known: Episode URLs from previous runs; when given, pagination
+                stops as soon as a page contributes only known episodes
+        """
         wait = WebDriverWait(self.driver, 10)
         max_attempts = 100  # Prevent infinite loops
-        
+        # Track progress via the live DOM instead of re-parsing the whole
+        # growing page_source with BeautifulSoup after every click - the
+        # full parse happens once, after pagination settles
+        loaded = self._loaded_episode_urls()
+
         for attempt in range(max_attempts):
             try:
                 # Wait for and find the "Load more" button
                 load_more_button = wait.until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, "button.button[data-appearance='secondary']"))
                 )
-                
+
                 # Scroll the button into view
                 self._scroll_to_element(load_more_button)
-                
+
                 # Try to click the button
                 try:
                     load_more_button.click()
                 except:
                     # If direct click fails, try using JavaScript
                     self.driver.execute_script("arguments[0].click();", load_more_button)
-                
+
                 logger.info("Clicked 'Load more' button")
                 time.sleep(2)  # Wait for content to load
-                
+
                 # Get current podcast count
-                current_podcasts = self._get_podcast_links()
-                if len(current_podcasts) == len(podcasts):
+                current = self._loaded_episode_urls()
+                if len(current) == len(loaded):
                     logger.info("No new podcasts loaded, stopping")
                     break
-                    
-                podcasts = current_podcasts
-                logger.info(f"Loaded {len(podcasts)} podcasts so far")
-                
+
+                if known is not None and all(url in known for url in current[len(loaded):]):
+                    logger.info("Page added only known episodes, stopping")
+                    break
+
+                loaded = current
+                logger.info(f"Loaded {len(loaded)} podcasts so far")
+
             except Exception as e:
                 logger.info(f"Finished loading podcasts: {e}")
                 break
-                
-        return podcasts
-    
+
+        return self._get_podcast_links()
+
+    def _loaded_episode_urls(self) -> List[str]:
+        """Episode URLs currently in the DOM, without an HTML re-parse"""
+        return self.driver.execute_script(
+            "return Array.from(document.querySelectorAll("
+            "'div.podcast-episode-block a.podcast-episode-block-image'"
+            ")).map(a => a.href);"
+        )
+
+
     def _get_podcast_links(self) -> List[Dict]:
         """Extract podcast links and titles from the current page"""
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+        page_source = self.driver.page_source
+        if HTMLParser is not None:
+            return self._parse_episode_blocks_selectolax(page_source)
+        return self._parse_episode_blocks_bs4(page_source)
+
+    @staticmethod
+    def _parse_episode_blocks_selectolax(page_source: str) -> List[Dict]:
+        """Episode extraction via selectolax's C selector engine"""
+        podcasts = []
+        for block in HTMLParser(page_source).css('div.podcast-episode-block'):
+            # Get the link and title
+            link_elem = block.css_first('a.podcast-episode-block-image')
+            title_elem = block.css_first('a.podcast-episode-block-title span.truncate')
+
+            if not (link_elem and title_elem):
+                continue
+
+            href = link_elem.attributes.get('href')
+            if not href:
+                continue
+            title = title_elem.text(strip=True)
+
+            # Get episode number and duration from meta data
+            episode_number = None
+            duration = None
+
+            for item in block.css('div.podcast-episode-block-meta span.meta-data-list-item'):
+                text = item.text(strip=True)
+                if EPISODE_RE.search(text):
+                    episode_number = text
+                    break
+
+            duration_elem = block.css_first('div.podcast-episode-block-footer div.text')
+            if duration_elem:
+                duration = duration_elem.text(strip=True)
+
+            # Make the URL absolute
+            if not href.startswith('http'):
+                href = f"https://bibleproject.com{href}"
+
+            podcasts.append({
+                'title': title,
+                'url': href,
+                'episode_number': episode_number,
+                'duration': duration
+            })
+
+        return podcasts
+
+    @staticmethod
+    def _parse_episode_blocks_bs4(page_source: str) -> List[Dict]:
+        """BeautifulSoup fallback when selectolax isn't installed"""
+        # Restrict parsing to the episode blocks - everything else on the
+        # page is irrelevant, and skipping it cuts parse time and memory
+        soup = BeautifulSoup(page_source, BS_PARSER,
+                             parse_only=SoupStrainer('div', class_='podcast-episode-block'))
         podcast_blocks = soup.find_all('div', class_='podcast-episode-block')
-        
+
         podcasts = []
         for block in podcast_blocks:
             # Get the link and title
             link_elem = block.find('a', class_='podcast-episode-block-image')
             title_elem = block.find('a', class_='podcast-episode-block-title')
-            
+
             if link_elem and title_elem:
                 href = link_elem.get('href')
                 title = title_elem.find('span', class_='truncate').text.strip()
-                
+
                 # Get episode number and duration from meta data
                 meta_data = block.find('div', class_='podcast-episode-block-meta')
                 episode_number = None
                 duration = None
-                
+
                 if meta_data:
                     # Extract episode number
-                    episode_text = meta_data.find('span', class_='meta-data-list-item', string=re.compile(r'Episode \d+'))
+                    episode_text = meta_data.find('span', class_='meta-data-list-item', string=EPISODE_RE)
                     if episode_text:
                         episode_number = episode_text.text.strip()
-                    
+
                     # Extract duration
                     duration_elem = block.find('div', class_='podcast-episode-block-footer')
                     if duration_elem:
                         duration_text = duration_elem.find('div', class_='text').text.strip()
                         duration = duration_text
-                
+
                 # Make the URL absolute
                 if not href.startswith('http'):
                     href = f"https://bibleproject.com{href}"
-                    
+
                 podcasts.append({
                     'title': title,
                     'url': href,
                     'episode_number': episode_number,
                     'duration': duration
                 })
-                
+
         return podcasts
     
+    @staticmethod
+    def _episode_num(podcast: Dict) -> Optional[int]:
+        """Parse the numeric episode number from a podcast entry"""
+        match = re.search(r'\d+', podcast.get('episode_number') or '')
+        return int(match.group()) if match else None
+
+    def _get_download_url_http(self, podcast_url: str) -> Optional[str]:
+        """
+        Get the download URL from a podcast page with a plain HTTP GET
+
+        The download button is server-rendered, so fetching the page and
+        selecting a.button[download] covers the normal case without the
+        browser round-trip. Returns None when the tag is missing so the
+        caller can fall back to the Selenium path.
+        """
+        response = self.make_request(podcast_url)
+        if not response:
+            return None
+
+        soup = BeautifulSoup(response.text, BS_PARSER, parse_only=SoupStrainer('a'))
+        button = soup.select_one('a.button[download]')
+        if button and button.get('href'):
+            return button['href']
+
+        return None
+
     def _get_download_url(self, podcast_url: str) -> Optional[str]:
         """Get the download URL from a podcast page"""
         self.driver.get(podcast_url)
@@ -178,27 +340,66 @@ class PodcastScraper(BaseScraper):
             
             # Log the number of podcasts found
             logger.info(f"Found {len(podcasts)} podcasts to process")
+            self.items_found = len(podcasts)
+
+            if self.since is not None:
+                podcasts = [p for p in podcasts
+                            if (num := self._episode_num(p)) is None or num >= self.since]
+                logger.info(f"{len(podcasts)} podcasts remain after --since={self.since}")
+
+            # Skip episodes already stored before spending a fetch on
+            # their download URLs - one query instead of discovering
+            # duplicates one add_content at a time
+            known_urls = self.db.get_existing_source_urls('podcast')
+            if known_urls:
+                before = len(podcasts)
+                podcasts = [p for p in podcasts if p['url'] not in known_urls]
+                logger.info(f"Skipping {before - len(podcasts)} already-stored podcasts")
             
-            # Store each podcast in Supabase
-            for podcast in podcasts:
-                logger.info(f"Processing podcast: {podcast['title']}")
-                
-                # Get download URL
-                download_url = self._get_download_url(podcast['url'])
-                if not download_url:
-                    logger.error(f"Failed to get download URL for podcast: {podcast['title']}")
-                    continue
-                
-                # Store in Supabase
-                if self._store_podcast(podcast, download_url):
-                    logger.info(f"Successfully stored podcast: {podcast['title']}")
-                else:
-                    logger.info(f"Podcast already exists or failed to store: {podcast['title']}")
-            
+            # Fetch download URLs concurrently - each is one HTTP GET, so
+            # episodes overlap their network time under the shared rate
+            # limit. Storage and the Selenium fallback (the driver isn't
+            # thread-safe) stay on this thread as results complete.
+            with ThreadPoolExecutor(max_workers=12) as pool:
+                futures = {pool.submit(self._get_download_url_http, p['url']): p for p in podcasts}
+                for future in as_completed(futures):
+                    podcast = futures[future]
+                    logger.info(f"Processing podcast: {podcast['title']}")
+
+                    try:
+                        download_url = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to get download URL for {podcast['url']}: {e}")
+                        download_url = None
+
+                    # Browser fallback when the page didn't render the
+                    # link statically
+                    if not download_url:
+                        download_url = self._get_download_url(podcast['url'])
+                    if not download_url:
+                        logger.error(f"Failed to get download URL for podcast: {podcast['title']}")
+                        continue
+
+                    # Store in Supabase
+                    if self._store_podcast(podcast, download_url):
+                        logger.info(f"Successfully stored podcast: {podcast['title']}")
+                    else:
+                        logger.info(f"Podcast already exists or failed to store: {podcast['title']}")
+
+            # Flush buffered rows to the index before marking anything as
+            # seen - episodes must not enter the pagination cache unless
+            # their rows made it to the database
+            self.flush_content()
+
+            # Record this run's episodes for the next incremental scrape
+            self._save_seen_urls({p['url'] for p in podcasts} | self._load_seen_urls())
+
+            self.record_scrape_results()
             return True
-            
+
         except Exception as e:
             logger.error(f"Error during podcast scraping: {e}")
+            self.record_scrape_results(status='failed', error=str(e))
             return False
             
         finally:
@@ -1,18 +1,25 @@
 import logging
+import os
 import re
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
 from pathlib import Path
-import time
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-    
+from selenium.webdriver.support.ui import WebDriverWait
+
 
-from scrapers.base import BaseScraper
+from config import REQUEST_TIMEOUT
+from scrapers.base import BaseScraper, BS_PARSER
 from utils.helpers import extract_text_from_pdf, clean_filename, merge_metadata
 
 logger = logging.getLogger(__name__)
 
+# Matches hosted PDF links (usually cloudfront) embedded in viewer pages
+PDF_URL_RE = re.compile(r'https://[^"\']+\.pdf')
+
 #Required metadata for study_notes will be type article with format below.
 CONTENT_TYPE = 'article'
 #However, we can only fill in the author and publication date for now. Page will be filled during chunking.
@@ -27,10 +34,16 @@ CONTENT_TYPE = 'article'
 class StudyNotesScraper(BaseScraper):
     """Scraper for BibleProject study notes"""
     
-    def __init__(self):
+    def __init__(self, use_selenium: bool = False):
         super().__init__(name="Study_Notes")
         self.study_notes_url = "https://bibleproject.com/downloads/study-notes/"
         self.source_type = CONTENT_TYPE
+        # Browser fallback for PDF resolution - the redirect chain is
+        # plain HTTP, so this is only needed if the site goes dynamic
+        self.use_selenium = use_selenium
+        # Lazily created pool of headless Chromes for the fallback, so
+        # repeated fallbacks reuse a browser instead of relaunching one
+        self._driver_pool = None
         
     def scrape(self) -> bool:
         """
@@ -48,38 +61,66 @@ class StudyNotesScraper(BaseScraper):
                 logger.error("Failed to load study notes page")
                 return False
             
-            # Parse the page
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
+            # Parse the page, restricted to the download cards
+            soup = BeautifulSoup(response.text, BS_PARSER,
+                                 parse_only=SoupStrainer('div', class_='download-bundles-card'))
+
+
             # Find all download bundle cards (parent containers)
             download_bundle_cards = soup.select('div.download-bundles-card')
             logger.info(f"Found {len(download_bundle_cards)} study note download cards")
             self.items_found = len(download_bundle_cards)
             
-            # Process each download card
+            # Collect the (resource link, title) pairs up front
+            links = []
             for card in download_bundle_cards:
-                try:
-                    # Extract the resource ID
-                    resource_id = card.get('data-popout-resource-id')
-                    if not resource_id:
-                        logger.warning("Could not find resource ID in card")
+                # Extract the resource ID
+                resource_id = card.get('data-popout-resource-id')
+                if not resource_id:
+                    logger.warning("Could not find resource ID in card")
+                    continue
+
+                # Find the title element
+                title_element = card.select_one('div.download-bundles-card-title')
+                title = title_element.text.strip() if title_element else "Study Notes"
+
+                logger.info(f"Processing study note: {title} (ID: {resource_id})")
+
+                # Get the download link directly from the popout
+                links.append((f"https://bibleproject.com/view-resource/{resource_id}/", title))
+
+            # Stage 1 (I/O-bound): resolve and download PDFs concurrently
+            downloaded = []
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                futures = {pool.submit(self._fetch_pdf, url, title): (url, title)
+                           for url, title in links}
+                for future in as_completed(futures):
+                    url, title = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.exception(f"Error processing download link {url}: {e}")
                         continue
-                    
-                    # Find the title element
-                    title_element = card.select_one('div.download-bundles-card-title')
-                    title = title_element.text.strip() if title_element else "Study Notes"
-                    
-                    logger.info(f"Processing study note: {title} (ID: {resource_id})")
-                    
-                    # Get the download link directly from the popout
-                    download_url = f"https://bibleproject.com/view-resource/{resource_id}/"
-                    
-                    # Process the download link
-                    self._process_download_link(download_url, title)
-                    
-                except Exception as e:
-                    logger.exception(f"Error processing resource card: {e}")
-            
+                    if result:
+                        downloaded.append(result)
+
+            # Stage 2 (CPU-bound): extract PDF text across cores, then
+            # store rows from this thread as extractions complete
+            if downloaded:
+                workers = min(os.cpu_count() or 1, len(downloaded))
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = {pool.submit(extract_text_from_pdf, entry[0]): entry
+                               for entry in downloaded}
+                    for future in as_completed(futures):
+                        pdf_path, title, pdf_url = futures[future]
+                        try:
+                            pdf_text = future.result()
+                        except Exception as e:
+                            logger.exception(f"Error extracting text from {pdf_path}: {e}")
+                            continue
+                        self._store_study_note(pdf_text, title, pdf_url, pdf_path)
+
+
             # Record scraping results
             self.record_scrape_results()
             logger.info(f"Completed scraping study notes. Found: {self.items_found}, New: {self.items_new}")
@@ -89,38 +130,100 @@ class StudyNotesScraper(BaseScraper):
             logger.exception(f"Error scraping study notes: {e}")
             self.record_scrape_results(status='failed', error=str(e))
             return False
-        
-    def _process_download_link(self, download_url, title):
-        """Process a download link to get the PDF using headless browser"""
-        
+
+        finally:
+            if self._driver_pool is not None:
+                self._driver_pool.close()
+
+    def _fetch_pdf(self, download_url, title):
+        """
+        Resolve and download one study-note PDF (the I/O stage)
+
+        Args:
+            download_url: The view-resource link for the study note
+            title: Study note title
+
+        Returns:
+            (pdf_path, title, pdf_url) tuple, or None if any step failed
+        """
         logger.info(f"Processing download link: {download_url} for {title}")
-        
-        try:
-            # Get PDF URL using headless browser
+
+        # Resolve the PDF URL by following redirects; the browser
+        # path only runs when explicitly enabled
+        pdf_url = self._get_pdf_url_http(download_url)
+        if not pdf_url and self.use_selenium:
             pdf_url = self._get_pdf_url_with_selenium(download_url)
-            
-            if not pdf_url:
-                logger.error(f"Failed to get PDF URL for {title}")
-                return
-                
-            logger.info(f"Found PDF URL: {pdf_url}")
-            
-            # Extract the filename from the URL
-            pdf_name = pdf_url.split('/')[-1]
-            if not pdf_name or not pdf_name.lower().endswith('.pdf'):
-                pdf_name = f"{clean_filename(title)}.pdf"
-            
-            # Download the PDF
-            pdf_path = self.download_file(pdf_url, pdf_name)
-            if not pdf_path:
-                logger.warning(f"Failed to download PDF from: {pdf_url}")
-                return
-            
-            # Process the PDF content
-            self._process_pdf(pdf_path, title, pdf_url)
-            
+
+        if not pdf_url:
+            logger.error(f"Failed to get PDF URL for {title}")
+            return None
+
+        logger.info(f"Found PDF URL: {pdf_url}")
+
+        # Extract the filename from the URL
+        pdf_name = pdf_url.split('/')[-1]
+        if not pdf_name or not pdf_name.lower().endswith('.pdf'):
+            pdf_name = f"{clean_filename(title)}.pdf"
+
+        # Download the PDF
+        pdf_path = self.download_file(pdf_url, pdf_name)
+        if not pdf_path:
+            logger.warning(f"Failed to download PDF from: {pdf_url}")
+            return None
+
+        return pdf_path, title, pdf_url
+
+    def _get_pdf_url_http(self, url):
+        """
+        Resolve the final PDF URL by following redirects over HTTP
+
+        The view-resource endpoint redirects straight to the hosted PDF,
+        so a HEAD request resolves the final URL without transferring the
+        file (download_file fetches it right after, and a plain GET here
+        would also serialize every multi-MB body into the HTTP cache).
+        When HEAD is rejected or the landing page embeds a viewer, fall
+        back to a streamed GET outside the cache - the make_request
+        pattern - reading the body only to scan viewer HTML for a .pdf
+        link.
+
+        Args:
+            url: The initial URL to navigate to
+
+        Returns:
+            str: The final PDF URL or None if not found
+        """
+        try:
+            response = self.session.head(url, allow_redirects=True, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            if response.url.lower().endswith('.pdf'):
+                return response.url
+        except Exception as e:
+            logger.warning(f"HEAD failed for {url}, retrying with GET: {e}")
+
+        bypass_cache = self.session.cache_disabled \
+            if hasattr(self.session, 'cache_disabled') else nullcontext
+        try:
+            with bypass_cache():
+                response = self.session.get(url, allow_redirects=True, stream=True,
+                                            timeout=REQUEST_TIMEOUT)
+                try:
+                    response.raise_for_status()
+                    if response.url.lower().endswith('.pdf'):
+                        return response.url
+
+                    # Viewer page: read the body now and look for
+                    # cloudfront links which often host PDFs
+                    pdf_links = PDF_URL_RE.findall(response.text)
+                    if pdf_links:
+                        return pdf_links[0]
+                finally:
+                    response.close()
         except Exception as e:
-            logger.exception(f"Error processing download link {download_url}: {e}")
+            logger.error(f"Error resolving PDF URL for {url}: {e}")
+            return None
+
+        logger.warning(f"Final URL is not a PDF: {response.url}")
+        return None
 
     def _get_pdf_url_with_selenium(self, url):
         """
@@ -132,84 +235,81 @@ class StudyNotesScraper(BaseScraper):
         Returns:
             str: The final PDF URL or None if not found
         """
-        import time
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.chrome.service import Service
-        
         logger.info(f"Getting PDF URL with headless browser: {url}")
-        
+
         try:
-            # Set up Chrome options
-            options = Options()
-            options.add_argument("--headless")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--window-size=1920,1080")
-            options.add_argument(f"user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-            
-            # Initialize Chrome driver
-            driver = webdriver.Chrome(options=options)
-            
-            # Navigate to URL
-            driver.get(url)
-            
-            # Wait for redirects to complete
-            time.sleep(3)  # Adjust timing based on site behavior
-            
-            # Get the final URL
-            final_url = driver.current_url
-            
-            # Check if we've reached a PDF URL
-            if final_url.lower().endswith('.pdf'):
-                return final_url
-            
-            # If not a PDF URL directly, check if there's a PDF viewer
-            if 'pdf' in final_url.lower() or 'view-resource' in final_url.lower():
-                # Try to find PDF URL in page source
-                page_source = driver.page_source
-                
-                # Look for cloudfront links which often host PDFs
-                import re
-                pdf_links = re.findall(r'https://[^"\']+\.pdf', page_source)
-                
-                if pdf_links:
-                    return pdf_links[0]
-            
-            # Close the driver
-            driver.quit()
-            
-            if not final_url.lower().endswith('.pdf'):
-                logger.warning(f"Final URL is not a PDF: {final_url}")
-                return None
-                
-            return final_url
-            
+            if self._driver_pool is None:
+                from utils.driver_pool import DriverPool
+                self._driver_pool = DriverPool(size=4, recycle_after=100,
+                                               options_factory=self._chrome_options)
+
+            with self._driver_pool.checkout() as driver:
+                # The page only needs to navigate, not render - block
+                # assets so the redirect isn't waiting on images/fonts
+                try:
+                    driver.execute_cdp_cmd('Network.enable', {})
+                    driver.execute_cdp_cmd('Network.setBlockedURLs', {
+                        'urls': ['*.png', '*.jpg', '*.jpeg', '*.gif',
+                                 '*.woff', '*.woff2', '*.css']
+                    })
+                except Exception:
+                    pass  # CDP unavailable (non-Chrome/remote driver)
+
+                # Navigate to URL
+                driver.get(url)
+
+                # Wait for the redirect chain to settle instead of a
+                # fixed sleep; worst case is bounded by the timeout
+                try:
+                    WebDriverWait(driver, 10).until(
+                        lambda d: d.current_url.lower().endswith('.pdf')
+                        or 'view-resource' in d.current_url.lower()
+                    )
+                except Exception:
+                    pass  # inspect whatever URL we ended up on
+
+                # Get the final URL
+                final_url = driver.current_url
+
+                # Check if we've reached a PDF URL
+                if final_url.lower().endswith('.pdf'):
+                    return final_url
+
+                # If not a PDF URL directly, check if there's a PDF viewer
+                if 'pdf' in final_url.lower() or 'view-resource' in final_url.lower():
+                    # Look for cloudfront links which often host PDFs
+                    pdf_links = PDF_URL_RE.findall(driver.page_source)
+
+                    if pdf_links:
+                        return pdf_links[0]
+
+            logger.warning(f"Final URL is not a PDF: {final_url}")
+            return None
+
         except Exception as e:
             logger.exception(f"Error getting PDF URL with Selenium: {e}")
             return None
-            
-        finally:
-            # Make sure to quit the driver
-            try:
-                if 'driver' in locals():
-                    driver.quit()
-            except:
-                pass
+
+    @staticmethod
+    def _chrome_options() -> Options:
+        """Chrome options for the PDF-resolution fallback browser"""
+        options = Options()
+        options.add_argument("--headless")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--window-size=1920,1080")
+        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+        return options
     
-    def _process_pdf(self, pdf_path: Path, title: str, download_url: str):
-        """Process a downloaded PDF file"""
-        logger.info(f"Processing PDF: {pdf_path}")
-        
+    def _store_study_note(self, pdf_text: str, title: str, download_url: str, pdf_path: Path):
+        """Store an extracted study note in the content index"""
+        logger.info(f"Storing study note from PDF: {pdf_path}")
+
         try:
-            # Extract text from PDF
-            pdf_text = extract_text_from_pdf(pdf_path)
-            
             if not pdf_text:
                 logger.warning(f"Could not extract text from PDF: {pdf_path}")
                 return
-        
 
             base_metadata = {
                 "author": "BibleProject",
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from pathlib import Path
 from processors.audio import AudioProcessor
@@ -21,7 +22,7 @@ def test_audio_processor():
     logger.info("Starting audio processing test")
     
     # Process the audio
-    result = processor.process_audio(test_url)
+    result = asyncio.run(processor.process_audio(test_url))
     
     if result:
         logger.info("Successfully processed audio file")
@@ -0,0 +1,105 @@
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+logger = logging.getLogger(__name__)
+
+def _default_options() -> Options:
+    """Standard headless Chrome options used by the scrapers"""
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--window-size=1920,1080")
+    return options
+
+class DriverPool:
+    """
+    Pool of reusable headless Chrome drivers
+
+    Chrome startup costs seconds and hundreds of MB per launch, so
+    callers that need a browser repeatedly check one out of the pool
+    instead of constructing their own. Drivers are launched lazily up to
+    `size`, and each is quit and replaced after `recycle_after` checkouts
+    to bound memory growth over a long scrape run.
+    """
+    def __init__(self, size: int = 4, recycle_after: int = 100,
+                 options_factory=_default_options):
+        self._size = size
+        self._recycle_after = recycle_after
+        self._options_factory = options_factory
+        self._idle: queue.Queue = queue.Queue()
+        self._uses: dict = {}  # id(driver) -> checkout count
+        self._lock = threading.Lock()
+        self._created = 0
+
+    @contextmanager
+    def checkout(self):
+        """
+        Borrow a driver for the duration of a with-block
+
+        Blocks until a driver is idle once `size` drivers exist.
+        """
+        driver = self._acquire()
+        try:
+            yield driver
+        finally:
+            self._release(driver)
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            launch = self._created < self._size
+            if launch:
+                self._created += 1
+
+        if launch:
+            try:
+                driver = webdriver.Chrome(options=self._options_factory())
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+            self._uses[id(driver)] = 0
+            return driver
+
+        return self._idle.get()
+
+    def _release(self, driver) -> None:
+        self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+        if self._uses[id(driver)] >= self._recycle_after:
+            logger.info("Recycling Chrome driver after %d uses", self._recycle_after)
+            self._uses.pop(id(driver), None)
+            self._quit(driver)
+            with self._lock:
+                self._created -= 1
+        else:
+            self._idle.put(driver)
+
+    def close(self) -> None:
+        """Quit every idle driver and reset the pool"""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._uses.pop(id(driver), None)
+            self._quit(driver)
+        with self._lock:
+            self._created = 0
+
+    @staticmethod
+    def _quit(driver) -> None:
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning("Error quitting Chrome driver: %s", e)
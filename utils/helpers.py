@@ -1,45 +1,288 @@
+import array
+import asyncio
+import hashlib
 import logging
+import multiprocessing
 import re
+import sqlite3
+import threading
 import time
 import os
 from pathlib import Path
 from typing import List, Dict, Any, Optional
+from bisect import bisect_right
+from functools import lru_cache
+from types import MappingProxyType
 from datetime import datetime
 import openai
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
 logger = logging.getLogger(__name__)
 
+# Patterns used on every filename/document; compiled once at import
+_RE_UNDERSCORE = re.compile(r'[_\s]+')
+# Filename-unsafe characters, each mapped to underscore
+_BAD_CHAR_TABLE = str.maketrans({c: '_' for c in '\\/*?:"<>|'})
+# Legacy bracket-style page markers, still recognized for text that was
+# extracted (and possibly stored) before the sentinel format below
+_RE_PAGE_BREAK = re.compile(r'\[PAGE_BREAK_(\d+)\]')
+_RE_PAGE_STRIP = re.compile(r'\[PAGE_BREAK_\d+\]')
+# Page markers are internal-only, so they use Private Use Area sentinels
+# around a fixed-width page number: locating them is a C-level str.split
+# instead of two regex passes over the whole document
+_PAGE_SENTINEL = '\ue000'
+_PAGE_SENTINEL_END = '\ue001'
+_RE_PARA = re.compile(r'\n{2,}')
+_RE_SENT = re.compile(r'(?<=[.!?])\s+')
+
+@lru_cache(maxsize=1)
+def _openai_client() -> "openai.OpenAI":
+    """Shared OpenAI client (one connection pool for the process)"""
+    from config import OPENAI_API_KEY
+
+    return openai.OpenAI(api_key=OPENAI_API_KEY)
+
+_EMBED_MODEL = "text-embedding-3-small"
+_embed_cache_lock = threading.Lock()
+
+def _as_vector(embedding: List[float]):
+    """Pack an API embedding as float32 when numpy is available"""
+    if np is not None:
+        return np.asarray(embedding, dtype=np.float32)
+    return embedding
+
+@lru_cache(maxsize=1)
+def _embed_cache() -> sqlite3.Connection:
+    """On-disk embedding cache; vectors stored as packed float32"""
+    from config import CACHE_DIR
+
+    conn = sqlite3.connect(str(CACHE_DIR / 'embeddings.sqlite3'),
+                           check_same_thread=False)
+    conn.execute('CREATE TABLE IF NOT EXISTS embeddings '
+                 '(key BLOB PRIMARY KEY, vec BLOB)')
+    return conn
+
+def _embed_key(text: str) -> bytes:
+    """Cache key for a text under the current embedding model"""
+    return hashlib.blake2b(f"{_EMBED_MODEL}:{text}".encode(),
+                           digest_size=16).digest()
+
+def _embed_cache_get(text: str) -> Optional[List[float]]:
+    """Return the cached vector for text, or None on a miss"""
+    try:
+        with _embed_cache_lock:
+            row = _embed_cache().execute(
+                'SELECT vec FROM embeddings WHERE key = ?',
+                (_embed_key(text),)).fetchone()
+    except Exception as e:
+        logger.warning(f"Embedding cache read failed: {e}")
+        return None
+    if row is None:
+        return None
+    if np is not None:
+        return np.frombuffer(row[0], dtype=np.float32).copy()
+    vec = array.array('f')
+    vec.frombytes(row[0])
+    return vec.tolist()
+
+def _embed_cache_put(text: str, vec: List[float]) -> None:
+    """Store a vector in the cache; failures only cost the cache hit"""
+    try:
+        if np is not None:
+            payload = np.asarray(vec, dtype=np.float32).tobytes()
+        else:
+            payload = array.array('f', vec).tobytes()
+        with _embed_cache_lock:
+            conn = _embed_cache()
+            conn.execute('INSERT OR REPLACE INTO embeddings VALUES (?, ?)',
+                         (_embed_key(text), payload))
+            conn.commit()
+    except Exception as e:
+        logger.warning(f"Embedding cache write failed: {e}")
+
 def create_embedding(text: str) -> List[float]:
     """
     Create an embedding vector for the given text
-    
+
     Args:
         text: Text to create embedding for
-        
+
     Returns:
-        List of floats representing the embedding vector
+        The embedding vector: a float32 ndarray when numpy is installed
+        (~6KB instead of ~43KB of boxed Python floats per vector), a
+        plain list otherwise
     """
     try:
-        from config import OPENAI_API_KEY
-        
-        # Set OpenAI API key
-        openai.api_key = OPENAI_API_KEY
-        
+        # Re-runs and duplicate paragraphs hit the disk cache instead of
+        # paying for the same API call again
+        cached = _embed_cache_get(text)
+        if cached is not None:
+            return cached
+
         # Create embedding
-        response = openai.embeddings.create(
-            model="text-embedding-3-small",
+        response = _openai_client().embeddings.create(
+            model=_EMBED_MODEL,
             input=text,
             encoding_format="float"
         )
-        
+
         # Return the embedding vector
-        return response.data[0].embedding
-        
+        embedding = _as_vector(response.data[0].embedding)
+        _embed_cache_put(text, embedding)
+        return embedding
+
     except Exception as e:
         logger.exception(f"Error creating embedding: {e}")
         # Return a zero vector as fallback (not ideal but prevents crashes)
+        if np is not None:
+            return np.zeros(1536, dtype=np.float32)
         return [0.0] * 1536  # Current dimension for OpenAI embeddings
 
+# OpenAI accepts up to 2048 inputs per embeddings request...
+EMBEDDING_BATCH_SIZE = 2048
+# ...within a token budget of 8191 per request; ~4 chars per token,
+# kept conservative so a batch is never rejected outright
+EMBEDDING_BATCH_CHARS = 8191 * 3
+
+def _embedding_batches(texts: List[str]):
+    """Yield slices of texts that fit one embeddings request"""
+    start = 0
+    size = 0
+    for i, text in enumerate(texts):
+        if i > start and (i - start >= EMBEDDING_BATCH_SIZE
+                          or size + len(text) > EMBEDDING_BATCH_CHARS):
+            yield texts[start:i]
+            start = i
+            size = 0
+        size += len(text)
+    if start < len(texts):
+        yield texts[start:]
+
+def create_embeddings(texts: List[str]) -> List[List[float]]:
+    """
+    Create embedding vectors for a batch of texts
+
+    Packs many inputs into each embeddings request instead of one request
+    per text, so N texts cost ceil(N / batch) round-trips instead of N.
+
+    Args:
+        texts: Texts to create embeddings for
+
+    Returns:
+        List of embedding vectors, aligned with the input order
+    """
+    if not texts:
+        return []
+
+    try:
+        client = _openai_client()
+
+        # Serve cached vectors locally; only the misses go to the API
+        embeddings: List[Optional[List[float]]] = [
+            _embed_cache_get(text) for text in texts
+        ]
+        miss_positions = [i for i, vec in enumerate(embeddings) if vec is None]
+        misses = [texts[i] for i in miss_positions]
+
+        fetched = []
+        for batch in _embedding_batches(misses):
+            response = client.embeddings.create(
+                model=_EMBED_MODEL,
+                input=batch,
+                encoding_format="float"
+            )
+            fetched.extend(item.embedding for item in response.data)
+
+        for position, embedding in zip(miss_positions, fetched):
+            vec = _as_vector(embedding)
+            embeddings[position] = vec
+            _embed_cache_put(texts[position], vec)
+
+        return embeddings
+
+    except Exception as e:
+        logger.exception(f"Error creating embeddings batch: {e}")
+        # Zero vectors as fallback, same shape as the single-text path
+        if np is not None:
+            return [np.zeros(1536, dtype=np.float32) for _ in texts]
+        return [[0.0] * 1536 for _ in texts]
+
+async def create_embeddings_async(texts: List[str], concurrency: int = 8) -> List[List[float]]:
+    """
+    Create embedding vectors for a batch of texts with pipelined requests
+
+    Async counterpart of create_embeddings: batches are sent through
+    AsyncOpenAI with up to `concurrency` requests in flight, so the
+    pipeline isn't idle waiting on each round trip in turn. Cached
+    vectors are served locally as in the sync path.
+
+    Args:
+        texts: Texts to create embeddings for
+        concurrency: Maximum embeddings requests in flight
+
+    Returns:
+        List of embedding vectors, aligned with the input order
+    """
+    if not texts:
+        return []
+
+    try:
+        from openai import AsyncOpenAI
+        from config import OPENAI_API_KEY
+
+        embeddings: List[Optional[List[float]]] = [
+            _embed_cache_get(text) for text in texts
+        ]
+        miss_positions = [i for i, vec in enumerate(embeddings) if vec is None]
+        misses = [texts[i] for i in miss_positions]
+
+        client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                response = await client.embeddings.create(
+                    model=_EMBED_MODEL,
+                    input=batch,
+                    encoding_format="float"
+                )
+            return [_as_vector(item.embedding) for item in response.data]
+
+        try:
+            results = await asyncio.gather(
+                *[embed_batch(batch) for batch in _embedding_batches(misses)]
+            )
+        finally:
+            await client.close()
+
+        fetched = [vec for batch in results for vec in batch]
+        for position, vec in zip(miss_positions, fetched):
+            embeddings[position] = vec
+            _embed_cache_put(texts[position], vec)
+
+        return embeddings
+
+    except Exception as e:
+        logger.exception(f"Error creating embeddings batch: {e}")
+        # Zero vectors as fallback, same shape as the sync paths
+        if np is not None:
+            return [np.zeros(1536, dtype=np.float32) for _ in texts]
+        return [[0.0] * 1536 for _ in texts]
+
 def clean_filename(filename: str) -> str:
     """
     Clean a string to make it safe for use as a filename
@@ -50,46 +293,411 @@ def clean_filename(filename: str) -> str:
     Returns:
         Safe filename
     """
-    # Replace invalid characters with underscore
-    clean = re.sub(r'[\\/*?:"<>|]', '_', filename)
+    # Replace invalid characters with underscore (C-level table lookup,
+    # no regex engine for the 1:1 case)
+    clean = filename.translate(_BAD_CHAR_TABLE)
     # Replace multiple spaces/underscores with single
-    clean = re.sub(r'[_\s]+', '_', clean)
+    clean = _RE_UNDERSCORE.sub('_', clean)
     # Remove leading/trailing underscores and spaces
-    return clean.strip('_').strip()
+    return clean.strip('_ \t\n')
+
+def _pdf_text_cache_path(pdf_path) -> Path:
+    """Cache file for a PDF's extracted text, keyed by content hash"""
+    from config import CACHE_DIR
+
+    cache_dir = CACHE_DIR / "pdf_text"
+    cache_dir.mkdir(exist_ok=True)
+
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(pdf_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            hasher.update(block)
+    return cache_dir / f"{hasher.hexdigest()}.txt"
+
+# Below this page count, spawning a process pool costs more than it
+# saves - page extraction is fast and worker startup is not
+_PARALLEL_PAGE_MIN = 32
+# Pages per worker task; coarse enough to amortize pickling overhead
+_PAGE_BLOCK = 10
+
+def _extract_page_block(pdf_path, start, stop) -> List[str]:
+    """Extract text for a contiguous page range (worker process entry)"""
+    with fitz.open(pdf_path) as doc:
+        return [doc[i].get_text() for i in range(start, stop)]
+
+def _extract_pages_parallel(pdf_path, total_pages: int) -> List[str]:
+    """Extract all page texts across worker processes, in page order"""
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    page_texts: List[Optional[str]] = [None] * total_pages
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        futures = {
+            pool.submit(_extract_page_block, pdf_path, start,
+                        min(start + _PAGE_BLOCK, total_pages)): start
+            for start in range(0, total_pages, _PAGE_BLOCK)
+        }
+        for future in as_completed(futures):
+            start = futures[future]
+            for offset, page_text in enumerate(future.result()):
+                page_texts[start + offset] = page_text
+    return page_texts
 
 def extract_text_from_pdf(pdf_path):
     """
     Extract text from a PDF file
-    
+
+    Extracted text is cached on disk keyed by the PDF's content hash,
+    so re-downloads of an unchanged PDF (same bytes, possibly a new URL)
+    cost one hash plus a file read instead of a full re-parse. Large
+    documents are extracted page-parallel across worker processes.
+
     Args:
         pdf_path: Path to the PDF file
-        
+
     Returns:
         str: Extracted text or empty string if failed
     """
+    if fitz is None:
+        logger.error("PyMuPDF is not installed; cannot extract PDF text")
+        return ""
+
     try:
-        import fitz  # PyMuPDF
-        
-        text = ""
-        page_texts = []
-        
+        cache_path = None
+        try:
+            cache_path = _pdf_text_cache_path(pdf_path)
+            if cache_path.exists():
+                return cache_path.read_text(encoding='utf-8')
+        except OSError as e:
+            logger.warning(f"PDF text cache unavailable for {pdf_path}: {e}")
+
         with fitz.open(pdf_path) as doc:
             total_pages = len(doc)
-            
-            for i, page in enumerate(doc):
-                page_text = page.get_text()
-                page_texts.append(page_text)
-                text += page_text
-                
-                # Add page markers for later chunking reference
-                if i < total_pages - 1:
-                    text += f"\n[PAGE_BREAK_{i+1}]\n"
-        
+
+            # Page-parallel extraction pays off on long documents; short
+            # ones go serial, as do calls already running in a child
+            # process (e.g. the study-notes extraction pool), which must
+            # not each fan out into pools of their own
+            if total_pages >= _PARALLEL_PAGE_MIN \
+                    and multiprocessing.parent_process() is None:
+                page_texts = None
+            else:
+                page_texts = [page.get_text() for page in doc]
+
+        if page_texts is None:
+            page_texts = _extract_pages_parallel(pdf_path, total_pages)
+
+        # Join once at the end; += on a growing string re-copies the
+        # whole document per page
+        parts = []
+        for i, page_text in enumerate(page_texts):
+            parts.append(page_text)
+
+            # Add page markers for later chunking reference
+            if i < total_pages - 1:
+                parts.append(f"\n{_PAGE_SENTINEL}{i+1:05d}{_PAGE_SENTINEL_END}\n")
+        text = "".join(parts)
+
+        if cache_path is not None:
+            try:
+                tmp_path = cache_path.with_suffix('.txt.part')
+                tmp_path.write_text(text, encoding='utf-8')
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                logger.warning(f"Failed to cache PDF text for {pdf_path}: {e}")
+
         return text
     except Exception as e:
         logging.exception(f"Error extracting text from PDF {pdf_path}: {e}")
         return ""
 
+if numba is not None and np is not None:
+    @numba.njit(cache=True)
+    def _plan_sentence_chunks_njit(lens, max_size, keep, out):
+        """
+        Greedy sentence packing over an int32 length array
+
+        Fills out with (start, end) sentence index pairs and returns the
+        pair count; each chunk keeps the last `keep` sentences of its
+        predecessor as overlap.
+        """
+        n = lens.size
+        count = 0
+        start = 0
+        while start < n:
+            size = 0
+            end = start
+            while end < n and (size + lens[end] <= max_size or end == start):
+                size += lens[end] + 1  # +1 for the joining space
+                end += 1
+            out[count, 0] = start
+            out[count, 1] = end
+            count += 1
+            if end >= n:
+                break
+            start = end - keep if end - keep > start else start + 1
+        return count
+
+def _plan_sentence_chunks(lens: List[int], max_size: int, overlap: int) -> List[tuple]:
+    """
+    Plan chunk boundaries over a list of sentence lengths
+
+    The packing loop only needs the lengths, so it runs as a compiled
+    numeric pass when numba is available; the caller slices the actual
+    sentence strings from the returned (start, end) index pairs.
+
+    Args:
+        lens: Length of each sentence
+        max_size: Maximum chunk size in characters
+        overlap: Overlap between chunks in characters (approximated as
+            overlap // 10 trailing sentences)
+
+    Returns:
+        List of (start, end) sentence index pairs
+    """
+    keep = overlap // 10
+
+    if numba is not None and np is not None:
+        arr = np.asarray(lens, dtype=np.int32)
+        out = np.empty((max(arr.size, 1), 2), dtype=np.int32)
+        count = _plan_sentence_chunks_njit(arr, np.int32(max_size), np.int32(keep), out)
+        return [(int(out[i, 0]), int(out[i, 1])) for i in range(count)]
+
+    spans = []
+    n = len(lens)
+    start = 0
+    while start < n:
+        size = 0
+        end = start
+        while end < n and (size + lens[end] <= max_size or end == start):
+            size += lens[end] + 1  # +1 for the joining space
+            end += 1
+        spans.append((start, end))
+        if end >= n:
+            break
+        start = end - keep if end - keep > start else start + 1
+    return spans
+
+def iter_pdf_paragraphs(pdf_path):
+    """
+    Stream (paragraph, page_number) pairs from a PDF
+
+    Yields paragraphs one page at a time instead of materializing the
+    whole document (and its page-break markers) as a single string, so
+    peak memory stays at one page regardless of document size. Pairs
+    with split_paragraphs_into_chunks for a fully streaming pipeline.
+
+    Paragraphs come from MuPDF's own layout blocks rather than
+    regex-splitting on blank lines, so segmentation matches the
+    document's actual structure at no extra cost.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Yields:
+        (paragraph_text, page_number) tuples, 1-based pages
+    """
+    if fitz is None:
+        logger.error("PyMuPDF is not installed; cannot extract PDF text")
+        return
+
+    with fitz.open(pdf_path) as doc:
+        for i, page in enumerate(doc):
+            # (x0, y0, x1, y1, text, block_no, block_type) per block;
+            # sort into reading order, keep text blocks (type 0) only
+            blocks = page.get_text("blocks")
+            blocks.sort(key=lambda block: (block[1], block[0]))
+            for block in blocks:
+                if block[6] != 0:
+                    continue
+                paragraph = block[4].strip()
+                if paragraph:
+                    yield paragraph, i + 1
+
+def split_paragraphs_into_chunks(paragraphs, max_size: int = 4000, overlap: int = 200):
+    """
+    Chunk a stream of (paragraph, page) pairs
+
+    Generator counterpart of split_text_into_chunks for callers that
+    stream paragraphs (e.g. from iter_pdf_paragraphs): only the open
+    chunk is held in memory, and pages arrive attached to paragraphs so
+    no position-to-page bookkeeping is needed.
+
+    Args:
+        paragraphs: Iterable of (paragraph_text, page_number) pairs
+        max_size: Maximum chunk size in characters
+        overlap: Overlap between chunks in characters
+
+    Yields:
+        Dictionaries with text and page information
+    """
+    current = []
+    pages = []
+    size = 0
+
+    for paragraph, page in paragraphs:
+        paragraph_size = len(paragraph)
+
+        # An oversized paragraph is sentence-split on its own
+        if paragraph_size > max_size:
+            if current:
+                yield {'text': '\n\n'.join(current), 'page': pages[0]}
+                current = []
+                pages = []
+                size = 0
+
+            sentences = _RE_SENT.split(paragraph)
+            sent_lens = [len(s) for s in sentences]
+            for start, end in _plan_sentence_chunks(sent_lens, max_size, overlap):
+                yield {'text': ' '.join(sentences[start:end]), 'page': page}
+
+        elif size + paragraph_size <= max_size:
+            current.append(paragraph)
+            pages.append(page)
+            size += paragraph_size + 2  # +2 for paragraph break
+
+        else:
+            yield {'text': '\n\n'.join(current), 'page': pages[0]}
+
+            # Keep a tail of paragraphs within the overlap budget
+            keep = 0
+            cutoff = len(current)
+            while cutoff > 0 and keep + len(current[cutoff - 1]) <= overlap:
+                cutoff -= 1
+                keep += len(current[cutoff]) + 2
+            current = current[cutoff:] + [paragraph]
+            pages = pages[cutoff:] + [page]
+            size = keep + paragraph_size + 2
+
+    if current:
+        yield {'text': '\n\n'.join(current), 'page': pages[0]}
+
+if numba is not None and np is not None:
+    @numba.njit(cache=True)
+    def _plan_paragraph_chunks_njit(lens, max_size, overlap, out):
+        """
+        Paragraph-level chunk planning over an int64 length array
+
+        Fills out with (kind, start, end, pos) rows and returns the row
+        count; see _plan_paragraph_chunks for the row meaning.
+        """
+        n = lens.size
+        count = 0
+        cstart = 0
+        cend = 0
+        size = 0
+        pos = 0
+        for i in range(n):
+            s = lens[i]
+            if s > max_size:
+                if cend > cstart:
+                    out[count, 0] = 0
+                    out[count, 1] = cstart
+                    out[count, 2] = cend
+                    out[count, 3] = pos - size
+                    count += 1
+                out[count, 0] = 1
+                out[count, 1] = i
+                out[count, 2] = i + 1
+                out[count, 3] = pos
+                count += 1
+                pos += s + 2
+                cstart = i + 1
+                cend = i + 1
+                size = 0
+            elif size + s <= max_size:
+                if cend == cstart:
+                    cstart = i
+                cend = i + 1
+                size += s + 2
+                pos += s + 2
+            else:
+                out[count, 0] = 0
+                out[count, 1] = cstart
+                out[count, 2] = cend
+                out[count, 3] = pos - size
+                count += 1
+                keep = 0
+                cutoff = cend
+                while cutoff > cstart and keep + lens[cutoff - 1] <= overlap:
+                    cutoff -= 1
+                    keep += lens[cutoff] + 2
+                cstart = cutoff
+                cend = i + 1
+                size = keep + s + 2
+                pos = pos - keep + s + 2
+        if cend > cstart:
+            out[count, 0] = 0
+            out[count, 1] = cstart
+            out[count, 2] = cend
+            out[count, 3] = pos - size
+            count += 1
+        return count
+
+def _plan_paragraph_chunks(lens: List[int], max_size: int, overlap: int) -> List[tuple]:
+    """
+    Plan chunk boundaries over a list of paragraph lengths
+
+    Like _plan_sentence_chunks this works purely on lengths, so the loop
+    compiles under numba when available. Each returned row is
+    (kind, start, end, pos): kind 0 emits paragraphs[start:end] as one
+    chunk whose page is looked up at clean-text position pos; kind 1
+    marks paragraphs[start] as oversized, to be sentence-split with pos
+    as its entry position.
+
+    Args:
+        lens: Length of each paragraph
+        max_size: Maximum chunk size in characters
+        overlap: Overlap between chunks in characters
+
+    Returns:
+        List of (kind, start, end, pos) rows
+    """
+    if numba is not None and np is not None:
+        arr = np.asarray(lens, dtype=np.int64)
+        # Worst case: two rows per paragraph plus the trailing emit
+        out = np.empty((2 * max(arr.size, 1) + 1, 4), dtype=np.int64)
+        count = _plan_paragraph_chunks_njit(arr, max_size, overlap, out)
+        return [tuple(int(v) for v in out[i]) for i in range(count)]
+
+    events = []
+    n = len(lens)
+    cstart = 0
+    cend = 0
+    size = 0
+    pos = 0
+    for i in range(n):
+        s = lens[i]
+        if s > max_size:
+            # Flush the open chunk, then hand the paragraph to the
+            # sentence splitter
+            if cend > cstart:
+                events.append((0, cstart, cend, pos - size))
+            events.append((1, i, i + 1, pos))
+            pos += s + 2  # +2 for paragraph break
+            cstart = cend = i + 1
+            size = 0
+        elif size + s <= max_size:
+            if cend == cstart:
+                cstart = i
+            cend = i + 1
+            size += s + 2
+            pos += s + 2
+        else:
+            events.append((0, cstart, cend, pos - size))
+            # Keep a tail of paragraphs within the overlap budget
+            keep = 0
+            cutoff = cend
+            while cutoff > cstart and keep + lens[cutoff - 1] <= overlap:
+                cutoff -= 1
+                keep += lens[cutoff] + 2
+            cstart = cutoff
+            cend = i + 1
+            size = keep + s + 2
+            pos = pos - keep + s + 2
+    if cend > cstart:
+        events.append((0, cstart, cend, pos - size))
+    return events
+
 def split_text_into_chunks(text: str, max_size: int = 4000, overlap: int = 200) -> List[Dict[str, Any]]:
     """
     Split text into overlapping chunks of approximately max_size characters
@@ -102,224 +710,113 @@ def split_text_into_chunks(text: str, max_size: int = 4000, overlap: int = 200)
     Returns:
         List of dictionaries with text and page information
     """
-    # Create a map of character positions to page numbers
-    page_map = {}
-    page_breaks = []
-    current_page = 1
-    
-    # Find all page break positions in the original text
-    for match in re.finditer(r'\[PAGE_BREAK_(\d+)\]', text):
-        page_num = int(match.group(1))
-        position = match.start()
-        page_breaks.append((position, page_num))
-    
-    # Sort page breaks by position
-    page_breaks.sort(key=lambda x: x[0])
-    
-    # Remove page markers for clean text
-    clean_text = re.sub(r'\[PAGE_BREAK_\d+\]', '', text)
-    
-    # Calculate offset map to convert between original and clean text positions
-    offset_map = []  # List of (original_pos, clean_text_pos)
-    clean_pos = 0
-    for i, char in enumerate(text):
-        if not text[i:].startswith('[PAGE_BREAK_'):
-            offset_map.append((i, clean_pos))
-            clean_pos += 1
-    
-    # Build the page map for clean text positions
-    for i in range(len(offset_map)):
-        orig_pos = offset_map[i][0]
-        clean_pos = offset_map[i][1]
-        
-        # Find the current page based on original position
-        current_page = 1  # Default page
-        for break_pos, page_num in page_breaks:
-            if orig_pos >= break_pos:
-                current_page = page_num
-        
-        page_map[clean_pos] = current_page
-    
-    # Split text by paragraphs
-    paragraphs = re.split(r'\n{2,}', clean_text)
-    
+    # One pass over the markers builds two parallel arrays: the clean-text
+    # position where each page starts and the page number active from
+    # there. Page lookups are then a bisect over a few hundred entries
+    # instead of a per-character dict built with nested Python loops.
+    clean_breaks = [0]
+    page_at = [1]
+    if _PAGE_SENTINEL in text:
+        # Sentinel markers: one C-level split locates every marker and
+        # strips it in the same pass, no regex engine involved
+        parts = text.split(_PAGE_SENTINEL)
+        clean_parts = [parts[0]]
+        pos = len(parts[0])
+        for part in parts[1:]:
+            if len(part) >= 6 and part[5] == _PAGE_SENTINEL_END \
+                    and part[:5].isdigit():
+                clean_breaks.append(pos)
+                page_at.append(int(part[:5]))
+                part = part[6:]
+            clean_parts.append(part)
+            pos += len(part)
+        clean_text = ''.join(clean_parts)
+    else:
+        # Legacy bracket markers from previously stored/cached text
+        removed = 0
+        for match in _RE_PAGE_BREAK.finditer(text):
+            clean_breaks.append(match.start() - removed)
+            page_at.append(int(match.group(1)))
+            removed += match.end() - match.start()
+        clean_text = _RE_PAGE_STRIP.sub('', text)
+
+    def page_for(pos: int) -> int:
+        """Page number at a clean-text position"""
+        return page_at[bisect_right(clean_breaks, pos) - 1]
+
+    # Split text by paragraphs; boundary planning runs over the lengths
+    # alone (compiled when numba is present), and only the emitted spans
+    # touch the strings
+    paragraphs = _RE_PARA.split(clean_text)
+    lens = list(map(len, paragraphs))
+
     chunks = []
-    current_chunk = []
-    current_size = 0
-    current_position = 0  # Position in clean text
-    
-    for paragraph in paragraphs:
-        paragraph_size = len(paragraph)
-        
-        # Determine page for this paragraph (use start position)
-        paragraph_page = page_map.get(current_position, 1)
-        
-        # If this paragraph alone exceeds max size, split it further
-        if paragraph_size > max_size:
-            # If we have content in current chunk, add it first
-            if current_chunk:
-                chunk_text = '\n\n'.join(current_chunk)
-                chunk_page = page_map.get(current_position - current_size, 1)
-                chunks.append({
-                    'text': chunk_text,
-                    'page': chunk_page
-                })
-                current_chunk = []
-                current_size = 0
-            
-            # Split large paragraph by sentences
-            sentences = re.split(r'(?<=[.!?])\s+', paragraph)
-            
-            sent_chunk = []
-            sent_size = 0
-            sent_position = current_position
-            
-            for sentence in sentences:
-                if sent_size + len(sentence) <= max_size or not sent_chunk:
-                    sent_chunk.append(sentence)
-                    sent_size += len(sentence) + 1  # +1 for space
-                else:
-                    chunk_text = ' '.join(sent_chunk)
-                    # Get page at start of sentence chunk
-                    sent_chunk_page = page_map.get(sent_position, paragraph_page)
-                    chunks.append({
-                        'text': chunk_text,
-                        'page': sent_chunk_page
-                    })
-                    
-                    # Create overlap with previous chunk
-                    overlap_point = max(0, len(sent_chunk) - int(overlap / 10))
-                    sent_chunk = sent_chunk[overlap_point:]
-                    sent_size = sum(len(s) + 1 for s in sent_chunk)
-                    
-                    # Update sent_position based on overlap
-                    overlap_chars = sum(len(s) + 1 for s in sent_chunk[:overlap_point])
-                    sent_position += overlap_chars
-                    
-                    sent_chunk.append(sentence)
-                    sent_size += len(sentence) + 1
-            
-            if sent_chunk:
-                chunk_text = ' '.join(sent_chunk)
-                chunks.append({
-                    'text': chunk_text,
-                    'page': paragraph_page
-                })
-                
-            current_position += paragraph_size + 2  # +2 for paragraph break
-            
-        # Regular paragraph handling
-        elif current_size + paragraph_size <= max_size:
-            current_chunk.append(paragraph)
-            current_size += paragraph_size + 2  # +2 for paragraph break
-            current_position += paragraph_size + 2
-        else:
-            # Current chunk is full, store it
-            chunk_text = '\n\n'.join(current_chunk)
-            # Get page at start of chunk
-            chunk_start_position = current_position - current_size
-            chunk_page = page_map.get(chunk_start_position, 1)
+    for kind, start, end, pos in _plan_paragraph_chunks(lens, max_size, overlap):
+        if kind == 0:
             chunks.append({
-                'text': chunk_text,
-                'page': chunk_page
+                'text': '\n\n'.join(paragraphs[start:end]),
+                'page': page_for(pos)
             })
-            
-            # Start a new chunk with overlap if possible
-            overlap_size = 0
-            overlap_chunks = []
-            
-            # Look back through paragraphs for overlap
-            for i in range(len(current_chunk) - 1, -1, -1):
-                p = current_chunk[i]
-                if overlap_size + len(p) <= overlap:
-                    overlap_chunks.insert(0, p)
-                    overlap_size += len(p) + 2
-                else:
-                    break
-            
-            current_chunk = overlap_chunks + [paragraph]
-            current_size = sum(len(p) + 2 for p in current_chunk)
-            
-            # Adjust position to account for overlap
-            overlap_chars = sum(len(p) + 2 for p in overlap_chunks)
-            current_position = current_position - overlap_chars + paragraph_size + 2
-    
-    # Don't forget any remaining text
-    if current_chunk:
-        chunk_text = '\n\n'.join(current_chunk)
-        # Get page at start of final chunk
-        chunk_start_position = current_position - current_size
-        chunk_page = page_map.get(chunk_start_position, 1)
-        chunks.append({
-            'text': chunk_text,
-            'page': chunk_page
-        })
-    
+            continue
+
+        # An oversized paragraph: split by sentences and plan chunk
+        # bounds over the sentence lengths
+        paragraph = paragraphs[start]
+        sentences = _RE_SENT.split(paragraph)
+        sent_lens = list(map(len, sentences))
+
+        # Character offset of each sentence within the paragraph
+        # (+1 per preceding sentence for the joining space)
+        offsets = [0]
+        for length in sent_lens:
+            offsets.append(offsets[-1] + length + 1)
+
+        for sent_start, sent_end in _plan_sentence_chunks(sent_lens, max_size, overlap):
+            chunks.append({
+                'text': ' '.join(sentences[sent_start:sent_end]),
+                'page': page_for(pos + offsets[sent_start])
+            })
+
     return chunks
-def get_metadata_template(content_type: str) -> Dict[str, Any]:
+# Required metadata fields per content type; every field starts as None,
+# so the keys are all a template needs
+_TEMPLATE_KEYS = {
+    'book': ('isbn', 'publisher', 'publication_year', 'author', 'page'),
+    'podcast': ('episode_number', 'episode_title', 'timestamp', 'duration'),
+    'article': ('page', 'publication_date', 'author'),
+    'video': ('timestamp', 'platform', 'video_length'),
+    'speech': ('speaker', 'speech_date'),
+    'research_paper': ('title', 'author', 'publication_year',
+                       'journal_name', 'doi'),
+    'blog': ('author', 'publication_date', 'url'),
+    'website': ('url', 'author'),
+    'bible': ('verse', 'chapter', 'book', 'translation'),
+}
+
+# Read-only template singletons, one per content type; copying one via
+# dict() is cheaper than rebuilding from the key tuple per call
+_FROZEN_TEMPLATES = {
+    content_type: MappingProxyType(dict.fromkeys(keys))
+    for content_type, keys in _TEMPLATE_KEYS.items()
+}
+_EMPTY_TEMPLATE = MappingProxyType({})
+
+def get_metadata_template(content_type: str, mutable: bool = True) -> Dict[str, Any]:
     """
     Get a metadata template with required fields for a specific content type
-    
+
     Args:
         content_type: Type of content (book, podcast, etc.)
-        
+        mutable: When False, return a shared read-only view instead of
+            allocating a fresh dict - for callers that only inspect the
+            required fields
+
     Returns:
         Dict: Template with required metadata fields initialized with None
+        (a read-only mapping when mutable is False)
     """
-    templates = {
-        'book': {
-            'isbn': None,
-            'publisher': None, 
-            'publication_year': None,
-            'author': None,
-            'page': None
-        },
-        'podcast': {
-            'episode_number': None,
-            'episode_title': None,
-            'timestamp': None,
-            'duration': None
-        },
-        'article': {
-            'page': None,
-            'publication_date': None,
-            'author': None
-        },
-        'video': {
-            'timestamp': None,
-            'platform': None,
-            'video_length': None
-        },
-        'speech': {
-            'speaker': None,
-            'speech_date': None
-        },
-        'research_paper': {
-            'title': None,
-            'author': None,
-            'publication_year': None,
-            'journal_name': None,
-            'doi': None
-        },
-        'blog': {
-            'author': None,
-            'publication_date': None,
-            'url': None
-        },
-        'website': {
-            'url': None,
-            'author': None
-        },
-        'bible': {
-            'verse': None,
-            'chapter': None,
-            'book': None,
-            'translation': None
-        }
-    }
-    
-    # Return requested template or empty dict if type not found
-    return templates.get(content_type, {}).copy()
+    template = _FROZEN_TEMPLATES.get(content_type, _EMPTY_TEMPLATE)
+    return dict(template) if mutable else template
 
 def merge_metadata(base_metadata: Dict[str, Any], 
                   new_metadata: Dict[str, Any]) -> Dict[str, Any]:
@@ -349,42 +846,44 @@ def cleanup_temp_files(min_age_hours: float = 0, file_types: List[str] = None) -
     Returns:
         int: Number of files deleted
     """
-    from pathlib import Path
     from config import TEMP_DIR
-    import time
-    import os
-    
+
     if not TEMP_DIR.exists():
         return 0
-    
+
     current_time = time.time()
     min_age_seconds = min_age_hours * 3600
+    # frozenset for O(1) suffix membership instead of a list scan per file
+    type_set = frozenset(file_types) if file_types else None
     deleted_count = 0
-    
+
     try:
-        for file_path in TEMP_DIR.glob('*'):
-            if not file_path.is_file():
-                continue
-                
-            # Check file age
-            file_age = current_time - file_path.stat().st_mtime
-            if file_age < min_age_seconds:
-                continue
-                
-            # Check file type
-            if file_types and file_path.suffix.lower() not in file_types:
-                continue
-                
-            # Delete the file
-            try:
-                os.remove(file_path)
-                logger.info(f"Deleted temporary file: {file_path.name}")
-                deleted_count += 1
-            except Exception as e:
-                logger.warning(f"Could not delete file {file_path.name}: {e}")
-                
+        # scandir DirEntry objects carry is_file/stat from the directory
+        # read, so large temp dirs aren't re-stat'ed file by file
+        with os.scandir(TEMP_DIR) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+
+                # Check file age
+                file_age = current_time - entry.stat().st_mtime
+                if file_age < min_age_seconds:
+                    continue
+
+                # Check file type
+                if type_set and os.path.splitext(entry.name)[1].lower() not in type_set:
+                    continue
+
+                # Delete the file
+                try:
+                    os.unlink(entry.path)
+                    logger.info(f"Deleted temporary file: {entry.name}")
+                    deleted_count += 1
+                except Exception as e:
+                    logger.warning(f"Could not delete file {entry.name}: {e}")
+
         return deleted_count
-        
+
     except Exception as e:
         logger.error(f"Error cleaning up temp files: {e}")
         return deleted_count
@@ -0,0 +1,76 @@
+import re
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Both paths treat every ASCII control byte as whitespace in addition to
+# str's \s set, so the fallback regex widens \s with \x00-\x20 to match
+# the byte scan exactly - the output (and content hashes derived from
+# it) must not depend on whether numba is installed
+_WS_RE = re.compile(r'[\s\x00-\x20]+')
+
+# Non-ASCII whitespace (NBSP, ideographic space, line/para separators,
+# NEL, ogham mark) normalized to plain spaces before the byte scan,
+# which only sees single-byte whitespace
+_NONASCII_WS = '\x85\xa0\u1680\u2028\u2029\u202f\u205f\u3000' \
+    + ''.join(chr(c) for c in range(0x2000, 0x200b))
+_NONASCII_WS_TABLE = str.maketrans(dict.fromkeys(_NONASCII_WS, ' '))
+
+if numba is not None and np is not None:
+    @numba.njit(cache=True)
+    def _collapse_ws_njit(buf, out):
+        """
+        Collapse whitespace runs in a uint8 buffer, writing into out
+
+        Treats bytes below 0x21 as whitespace (covers all ASCII whitespace;
+        UTF-8 continuation bytes are >= 0x80 so multi-byte characters pass
+        through untouched). Returns the new length.
+        """
+        n = 0
+        prev_ws = False
+        for i in range(buf.size):
+            b = buf[i]
+            if b < 0x21:
+                if not prev_ws:
+                    out[n] = 0x20
+                    n += 1
+                prev_ws = True
+            else:
+                out[n] = b
+                n += 1
+                prev_ws = False
+        return n
+
+def collapse_whitespace(text: str) -> str:
+    """
+    Collapse runs of whitespace into single spaces
+
+    Whitespace here means str's \\s set (including Unicode whitespace
+    such as NBSP, which scraped HTML and PDFs are full of) plus the
+    remaining ASCII control bytes. Runs as a compiled byte scan when
+    numba is installed - the whitespace collapse is the hot CPU path
+    when cleaning large PDF-extracted texts - with non-ASCII whitespace
+    normalized to plain spaces first so both paths produce identical
+    text (and identical content hashes) regardless of numba.
+
+    Args:
+        text: Text to collapse
+
+    Returns:
+        Text with each whitespace run replaced by a single space
+    """
+    if numba is None or np is None:
+        return _WS_RE.sub(' ', text)
+
+    buf = np.frombuffer(text.translate(_NONASCII_WS_TABLE).encode('utf-8'),
+                        dtype=np.uint8)
+    out = np.empty(buf.size, dtype=np.uint8)
+    n = _collapse_ws_njit(buf, out)
+    return bytes(out[:n]).decode('utf-8')